@@ -110,7 +110,8 @@ class ResonateComponent:
             while self.is_running():
                 try:
                     self.metrics.memory_usage = proc.memory_info().rss / 1024 / 1024  # MB
-                    self.metrics.cpu_percent = proc.cpu_percent(interval=1)
+                    # The 1s sampling window sleeps; keep it off the event loop
+                    self.metrics.cpu_percent = await asyncio.to_thread(proc.cpu_percent, 1)
                     await asyncio.sleep(30)  # Check every 30 seconds
                 except (psutil.NoSuchProcess, psutil.AccessDenied):
                     break
@@ -408,7 +409,7 @@ class ResonateLauncher:
                 
                 # System metrics
                 system_memory = psutil.virtual_memory().percent
-                system_cpu = psutil.cpu_percent(interval=1)
+                system_cpu = await asyncio.to_thread(psutil.cpu_percent, 1)
                 
                 logger.info(
                     f"📊 Performance: Components: {active_count}, "
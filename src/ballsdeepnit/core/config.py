@@ -3,9 +3,9 @@ Performance-optimized configuration management with caching and validation.
 """
 
 import os
-from functools import lru_cache
+from functools import cached_property, lru_cache
 from pathlib import Path
-from typing import Any, Dict, List, Optional, Set
+from typing import Any, Dict, FrozenSet, List, Optional
 
 from pydantic import Field, validator
 from pydantic_settings import BaseSettings, SettingsConfigDict
@@ -140,9 +140,8 @@ class Settings(BaseSettings):
         for directory in [self.PLUGINS_DIR, self.LOGS_DIR, self.CACHE_DIR]:
             directory.mkdir(parents=True, exist_ok=True)
     
-    @property
-    @lru_cache(maxsize=1)
-    def enabled_features(self) -> Set[str]:
+    @cached_property
+    def enabled_features(self) -> FrozenSet[str]:
         """Get a cached set of enabled features for fast lookup."""
         features = set()
         if self.ENABLE_HOT_RELOAD:
@@ -155,10 +154,9 @@ class Settings(BaseSettings):
             features.add("web_dashboard")
         if self.ENABLE_API_ENDPOINTS:
             features.add("api_endpoints")
-        return features
+        return frozenset(features)
     
-    @property
-    @lru_cache(maxsize=1)
+    @cached_property
     def is_production(self) -> bool:
         """Check if running in production mode."""
         return not self.DEBUG and os.getenv("ENVIRONMENT") == "production"
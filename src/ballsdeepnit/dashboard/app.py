@@ -3,9 +3,11 @@ High-performance FastAPI dashboard with optimizations for ballsDeepnit.
 """
 
 import asyncio
+import hashlib
+import json
 import time
 from contextlib import asynccontextmanager
-from typing import Any, Dict, List, Optional
+from typing import Any, Callable, Dict, List, Optional
 
 try:
     import orjson
@@ -13,49 +15,155 @@ try:
 except ImportError:
     JSON_AVAILABLE = False
 
-from fastapi import FastAPI, HTTPException, Depends, BackgroundTasks, Request
+try:
+    import zstandard
+    ZSTD_AVAILABLE = True
+except ImportError:
+    ZSTD_AVAILABLE = False
+
+try:
+    import httptools  # noqa: F401
+    HTTPTOOLS_AVAILABLE = True
+except ImportError:
+    HTTPTOOLS_AVAILABLE = False
+
+from fastapi import FastAPI, HTTPException, BackgroundTasks, Request, WebSocket, WebSocketDisconnect
 from fastapi.middleware.cors import CORSMiddleware
 from fastapi.middleware.gzip import GZipMiddleware
-from fastapi.responses import JSONResponse
+from fastapi.responses import JSONResponse, Response, StreamingResponse
+from fastapi.routing import APIRoute
 from fastapi.staticfiles import StaticFiles
 from fastapi.templating import Jinja2Templates
+from starlette.datastructures import MutableHeaders
+from starlette.routing import Route
+import psutil
 import uvicorn
 
-from ..core.config import settings
-from ..monitoring.performance import performance_monitor, get_memory_usage, optimize_memory_usage
+from ..core.config import settings, ENABLE_PERFORMANCE_MONITORING
+from ..monitoring.performance import (
+    UVLOOP_AVAILABLE,
+    performance_monitor,
+    get_memory_usage,
+    optimize_memory_usage,
+)
 from ..utils.logging import get_logger, timing_decorator
 from ..utils.cache import CacheManager
 
+logger = get_logger(__name__)
+
+# uvloop and the C httptools parser are used whenever installed; uvloop can
+# still be opted out of with EVENT_LOOP_POLICY=asyncio.
+UVICORN_LOOP = (
+    "uvloop"
+    if UVLOOP_AVAILABLE and settings.performance.EVENT_LOOP_POLICY != "asyncio"
+    else "asyncio"
+)
+UVICORN_HTTP = "httptools" if HTTPTOOLS_AVAILABLE else "h11"
+
+# Feature flags are fixed for the process lifetime; materialize them once
+ENABLED_FEATURES = tuple(sorted(settings.enabled_features))
+
+
+if JSON_AVAILABLE:
+    _dumps = orjson.dumps
+    _ORJSON_OPTIONS = orjson.OPT_SERIALIZE_NUMPY | orjson.OPT_NAIVE_UTC | orjson.OPT_UTC_Z
+    
+    def _encode_json(content: Any) -> bytes:
+        """Encode content to JSON bytes with orjson."""
+        return _dumps(content, option=_ORJSON_OPTIONS, default=str)
+else:
+    def _encode_json(content: Any) -> bytes:
+        """Encode content to compact JSON bytes with the standard library."""
+        return json.dumps(
+            content, ensure_ascii=False, separators=(",", ":"), default=str
+        ).encode("utf-8")
+
+
+class _OrjsonResponse(Response):
+    """JSON response using orjson for better performance.
+    
+    Subclasses Response directly (like FastAPI's ORJSONResponse) so the
+    media type is a class constant and JSONResponse's extra __init__ layer
+    is skipped.
+    """
+    
+    media_type = "application/json"
+    
+    def render(self, content: Any) -> bytes:
+        return _encode_json(content)
+
 
-class OptimizedJSONResponse(JSONResponse):
-    """JSON response using orjson for better performance."""
+class _StdlibResponse(JSONResponse):
+    """JSON response using the standard library encoder."""
     
     def render(self, content: Any) -> bytes:
-        if JSON_AVAILABLE:
-            return orjson.dumps(content)
-        return super().render(content)
+        # Same encoder (and default=str fallback) as the pre-encoded bodies
+        return _encode_json(content)
+
+
+# Resolve the encoder once at import so render() never branches
+OptimizedJSONResponse = _OrjsonResponse if JSON_AVAILABLE else _StdlibResponse
+
+
+class OptimizedRequest(Request):
+    """Request that parses JSON bodies using orjson for better performance."""
+    
+    async def json(self) -> Any:
+        if not hasattr(self, "_json"):
+            body = await self.body()
+            self._json = orjson.loads(body) if JSON_AVAILABLE else json.loads(body)
+        return self._json
+
+
+class OptimizedRoute(APIRoute):
+    """API route that hands handlers an OptimizedRequest."""
+    
+    def get_route_handler(self):
+        original_handler = super().get_route_handler()
+        
+        async def route_handler(request: Request):
+            return await original_handler(OptimizedRequest(request.scope, request.receive))
+        
+        return route_handler
 
 
 # Performance-optimized lifespan context manager
 @asynccontextmanager
 async def lifespan(app: FastAPI):
     """Manage application lifespan with performance optimizations."""
-    logger = get_logger(__name__)
-    
     # Startup
     logger.info("Starting ballsDeepnit dashboard")
     
     # Start performance monitoring
-    if settings.monitoring.ENABLE_PERFORMANCE_MONITORING:
+    if ENABLE_PERFORMANCE_MONITORING:
         await performance_monitor.start_monitoring()
     
     # Initialize cache
     app.state.cache_manager = CacheManager()
     await app.state.cache_manager.initialize()
     
+    # Settings do not change at runtime; encode the config response once
+    app.state.config_bytes = _encode_json(_build_config())
+    app.state.config_etag = _make_etag(app.state.config_bytes)
+    
+    # Prime the process CPU counter used by the status snapshot; its
+    # baseline is kept on the Process object, so any thread can read it.
+    _PROCESS.cpu_percent(interval=None)
+    
     # Pre-warm critical endpoints
+    app.state.inflight = {}
+    app.state.system_status_body = None
     await _prewarm_cache(app)
     
+    # Keep the system status snapshot fresh off the request path
+    app.state.status_task = asyncio.create_task(_status_refresher(app))
+    
+    # Single producer for all /ws/metrics subscribers
+    app.state.metric_subscribers = {}
+    app.state.latest_metrics = None
+    app.state.latest_metrics_at = 0.0
+    app.state.broadcast_task = asyncio.create_task(_metrics_broadcaster(app))
+    
     logger.info("Dashboard startup completed")
     
     yield
@@ -63,10 +171,20 @@ async def lifespan(app: FastAPI):
     # Shutdown
     logger.info("Shutting down dashboard")
     
+    for task in (app.state.status_task, app.state.broadcast_task):
+        task.cancel()
+        try:
+            await task
+        except asyncio.CancelledError:
+            pass
+        except Exception as e:
+            # A crashed background task must not skip the cleanup below
+            logger.error(f"Background task failed: {e}")
+    
     if hasattr(app.state, 'cache_manager'):
         await app.state.cache_manager.close()
     
-    if settings.monitoring.ENABLE_PERFORMANCE_MONITORING:
+    if ENABLE_PERFORMANCE_MONITORING:
         await performance_monitor.stop_monitoring()
     
     logger.info("Dashboard shutdown completed")
@@ -74,11 +192,9 @@ async def lifespan(app: FastAPI):
 
 async def _prewarm_cache(app: FastAPI) -> None:
     """Pre-warm cache with frequently accessed data."""
-    logger = get_logger(__name__)
     try:
-        # Pre-cache system status
-        cache_manager = app.state.cache_manager
-        await cache_manager.set("system_status", await _get_system_status(), ttl=30)
+        # Pre-compute the system status snapshot
+        app.state.system_status_body = await asyncio.to_thread(_system_status_body)
         logger.info("Cache pre-warming completed")
     except Exception as e:
         logger.warning(f"Cache pre-warming failed: {e}")
@@ -95,15 +211,9 @@ app = FastAPI(
     redoc_url="/redoc" if settings.DEBUG else None,
 )
 
-# Add performance middleware
-app.add_middleware(GZipMiddleware, minimum_size=1000)
-app.add_middleware(
-    CORSMiddleware,
-    allow_origins=["*"] if settings.DEBUG else ["http://localhost:3000"],
-    allow_credentials=True,
-    allow_methods=["*"],
-    allow_headers=["*"],
-)
+# Must be set before any route is declared so every API route picks it up
+if JSON_AVAILABLE:
+    app.router.route_class = OptimizedRoute
 
 
 class PerformanceMiddleware:
@@ -111,41 +221,45 @@ class PerformanceMiddleware:
     
     def __init__(self, app):
         self.app = app
-        self.logger = get_logger(__name__)
+        self._enabled = ENABLE_PERFORMANCE_MONITORING
+        # Probes, cheap polled endpoints and long-lived streams are not worth timing
+        self._fast_paths = frozenset({"/health", "/api/performance/memory", "/sse/metrics"})
+        self._threshold_ns = 1_000_000_000  # Requests taking more than 1 second
+        self._monotonic_ns = time.monotonic_ns
     
     async def __call__(self, scope, receive, send):
         if scope["type"] != "http":
             await self.app(scope, receive, send)
             return
         
-        start_time = time.perf_counter()
-        request_size = scope.get("content_length", 0)
-        
-        # Create a custom send function to track response size
-        response_size = 0
+        # HTTP scopes always carry both keys
+        path = scope["path"]
+        method = scope["method"]
         
-        async def custom_send(message):
-            nonlocal response_size
-            if message["type"] == "http.response.body":
-                response_size += len(message.get("body", b""))
-            await send(message)
+        # Pass straight through when timing is disabled, for CORS preflights
+        # (answered by CORSMiddleware further out) and for probe endpoints.
+        if not self._enabled or method == "OPTIONS" or path in self._fast_paths:
+            await self.app(scope, receive, send)
+            return
         
+        start_ns = self._monotonic_ns()
         try:
-            await self.app(scope, receive, custom_send)
+            await self.app(scope, receive, send)
         finally:
-            duration = time.perf_counter() - start_time
+            duration_ns = self._monotonic_ns() - start_ns
             
             # Log slow requests
-            if duration > 1.0:  # Requests taking more than 1 second
-                path = scope.get("path", "unknown")
-                method = scope.get("method", "unknown")
-                self.logger.warning(
-                    f"Slow request: {method} {path} took {duration:.3f}s",
+            if duration_ns > self._threshold_ns:
+                # %-style arguments defer formatting until a handler accepts the record
+                logger.warning(
+                    "Slow request: %s %s took %.3fs",
+                    method,
+                    path,
+                    duration_ns / 1_000_000_000,
                     extra={
                         "performance": {
-                            "duration_ms": duration * 1000,
-                            "request_size_bytes": request_size,
-                            "response_size_bytes": response_size,
+                            "duration_ms": duration_ns / 1_000_000,
+                            "request_size_bytes": scope.get("content_length", 0),
                             "path": path,
                             "method": method,
                         }
@@ -153,42 +267,224 @@ class PerformanceMiddleware:
                 )
 
 
+def _accepts_encoding(accept_encoding: str, coding: str) -> bool:
+    """Return True if an Accept-Encoding header allows coding (q > 0)."""
+    for part in accept_encoding.split(","):
+        name, _, params = part.partition(";")
+        if name.strip().lower() != coding:
+            continue
+        for param in params.split(";"):
+            key, _, value = param.partition("=")
+            if key.strip().lower() == "q":
+                try:
+                    return float(value) > 0
+                except ValueError:
+                    return False
+        return True
+    return False
+
+
+class CompressionMiddleware:
+    """Compress responses with zstd when the client accepts it, else gzip."""
+    
+    # Already compressed or latency-sensitive streams, as in GZipMiddleware
+    _EXCLUDED_TYPES = (
+        "text/event-stream", "image/", "audio/", "video/", "font/woff",
+        "application/zip", "application/gzip", "application/x-gzip",
+    )
+    
+    def __init__(self, app, minimum_size: int = 1000, zstd_level: int = 3) -> None:
+        self.app = app
+        self.minimum_size = minimum_size
+        self.zstd_level = zstd_level
+        self.gzip = GZipMiddleware(app, minimum_size=minimum_size)
+        # Middleware runs on the event loop thread, so one compressor is
+        # reused for every complete body. Streams each get their own
+        # compressobj, since a compressor can only run one stream at a time.
+        self._zstd = zstandard.ZstdCompressor(level=zstd_level) if ZSTD_AVAILABLE else None
+    
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+        
+        accept_encoding = ""
+        for name, value in scope["headers"]:
+            if name == b"accept-encoding":
+                accept_encoding = value.decode("latin-1")
+                break
+        
+        if self._zstd is not None and _accepts_encoding(accept_encoding, "zstd"):
+            await self._zstd_response(scope, receive, send)
+        elif _accepts_encoding(accept_encoding, "gzip"):
+            await self.gzip(scope, receive, send)
+        else:
+            await self.app(scope, receive, send)
+    
+    async def _zstd_response(self, scope, receive, send):
+        start_message = None
+        passthrough = False
+        stream = None
+        
+        async def zstd_send(message):
+            nonlocal start_message, passthrough, stream
+            message_type = message["type"]
+            
+            if message_type == "http.response.start":
+                headers = MutableHeaders(raw=message["headers"])
+                media_type = headers.get("content-type", "").partition(";")[0].strip().lower()
+                passthrough = (
+                    "content-encoding" in headers
+                    or message["status"] == 206
+                    or media_type.startswith(self._EXCLUDED_TYPES)
+                )
+                if passthrough:
+                    await send(message)
+                else:
+                    # Hold the headers until we know whether the body is compressed
+                    start_message = message
+                return
+            
+            if passthrough or message_type != "http.response.body":
+                if start_message is not None:
+                    await send(start_message)
+                    start_message = None
+                await send(message)
+                return
+            
+            body = message.get("body", b"")
+            more_body = message.get("more_body", False)
+            
+            if start_message is not None:
+                headers = MutableHeaders(raw=start_message["headers"])
+                if not more_body and len(body) < self.minimum_size:
+                    # Too small to be worth compressing
+                    passthrough = True
+                    await send(start_message)
+                    start_message = None
+                    await send(message)
+                    return
+                
+                headers["Content-Encoding"] = "zstd"
+                headers.add_vary_header("Accept-Encoding")
+                if more_body:
+                    stream = zstandard.ZstdCompressor(level=self.zstd_level).compressobj()
+                    del headers["Content-Length"]
+                else:
+                    body = self._zstd.compress(body)
+                    headers["Content-Length"] = str(len(body))
+                await send(start_message)
+                start_message = None
+                if stream is None:
+                    await send({**message, "body": body})
+                    return
+            
+            # Streamed body: flush each chunk so clients see it immediately
+            if more_body:
+                body = stream.compress(body) + stream.flush(zstandard.COMPRESSOBJ_FLUSH_BLOCK)
+            else:
+                body = stream.compress(body) + stream.flush()
+            await send({**message, "body": body})
+        
+        await self.app(scope, receive, zstd_send)
+
+
+# Add middleware. Starlette wraps them in reverse order of registration, so
+# PerformanceMiddleware is innermost and CORSMiddleware outermost: CORS
+# preflights are answered (from headers CORSMiddleware precomputes at
+# construction) before compression or timing work is done.
 app.add_middleware(PerformanceMiddleware)
+app.add_middleware(CompressionMiddleware, minimum_size=1000)
+app.add_middleware(
+    CORSMiddleware,
+    allow_origins=["*"] if settings.DEBUG else ["http://localhost:3000"],
+    allow_credentials=True,
+    allow_methods=["*"],
+    allow_headers=["*"],
+)
 
 
-# Dependency for cache manager
-async def get_cache_manager() -> "CacheManager":
-    """Get the cache manager dependency."""
-    return app.state.cache_manager
+def _make_etag(body: bytes) -> str:
+    """Build a weak ETag from a response body."""
+    return f'W/"{hashlib.blake2b(body, digest_size=8).hexdigest()}"'
+
+
+def _etag_matches(if_none_match: str, etag: str) -> bool:
+    """Check an If-None-Match header against an ETag using weak comparison."""
+    opaque = etag.removeprefix("W/")
+    for candidate in if_none_match.split(","):
+        candidate = candidate.strip()
+        if candidate == "*" or candidate.removeprefix("W/") == opaque:
+            return True
+    return False
+
+
+def _conditional_response(
+    request: Request, body: bytes, etag: str, cache_control: str
+) -> Response:
+    """Return 304 when the client already holds this body, else the JSON body."""
+    headers = {"ETag": etag, "Cache-Control": cache_control}
+    if _etag_matches(request.headers.get("if-none-match", ""), etag):
+        return Response(status_code=304, headers=headers)
+    return Response(body, media_type="application/json", headers=headers)
+
+
+async def _single_flight(key: str, compute_func: Callable) -> Any:
+    """Run compute_func once for all concurrent callers sharing the same key."""
+    inflight = app.state.inflight
+    task = inflight.get(key)
+    if task is None:
+        if asyncio.iscoroutinefunction(compute_func):
+            task = asyncio.ensure_future(compute_func())
+        else:
+            task = asyncio.ensure_future(asyncio.to_thread(compute_func))
+        inflight[key] = task
+        task.add_done_callback(lambda _: inflight.pop(key, None))
+    # Shield so one cancelled caller does not cancel the shared computation
+    return await asyncio.shield(task)
+
+
+async def _cached_or_compute(
+    cache_manager: CacheManager,
+    key: str,
+    ttl: int,
+    compute_func: Callable,
+) -> Any:
+    """Return a cached value, coalescing concurrent misses into one computation."""
+    cached = await cache_manager.get(key)
+    if cached:
+        return cached
+    
+    async def compute_and_cache() -> Any:
+        if asyncio.iscoroutinefunction(compute_func):
+            value = await compute_func()
+        else:
+            value = compute_func()
+        await cache_manager.set(key, value, ttl=ttl)
+        return value
+    
+    return await _single_flight(key, compute_and_cache)
 
 
 # Performance monitoring endpoints
 @app.get("/api/performance/metrics")
 @timing_decorator("dashboard.performance_metrics")
-async def get_performance_metrics(
-    cache_manager: CacheManager = Depends(get_cache_manager)
-):
+async def get_performance_metrics():
     """Get current performance metrics with caching."""
-    cache_key = "performance_metrics"
-    
-    # Try to get from cache first
-    cached_metrics = await cache_manager.get(cache_key)
-    if cached_metrics:
-        return cached_metrics
-    
-    # Get fresh metrics
-    metrics = performance_monitor.get_performance_report()
-    
     # Cache for 5 seconds to reduce load
-    await cache_manager.set(cache_key, metrics, ttl=5)
-    
-    return metrics
+    return await _cached_or_compute(
+        app.state.cache_manager,
+        "performance_metrics",
+        5,
+        performance_monitor.get_performance_report,
+    )
 
 
 @app.get("/api/performance/memory")
-async def get_memory_metrics():
+async def get_memory_metrics(request: Request):
     """Get current memory usage information."""
-    return get_memory_usage()
+    body = _encode_json(get_memory_usage())
+    return _conditional_response(request, body, _make_etag(body), "no-cache")
 
 
 @app.post("/api/performance/optimize")
@@ -200,35 +496,41 @@ async def optimize_performance(background_tasks: BackgroundTasks):
 
 @app.get("/api/system/status")
 @timing_decorator("dashboard.system_status")
-async def get_system_status(
-    cache_manager: CacheManager = Depends(get_cache_manager)
-):
-    """Get cached system status for fast dashboard loading."""
-    cache_key = "system_status"
-    
-    cached_status = await cache_manager.get(cache_key)
-    if cached_status:
-        return cached_status
-    
-    status = await _get_system_status()
-    await cache_manager.set(cache_key, status, ttl=10)
-    
-    return status
+async def get_system_status():
+    """Get the background-refreshed system status for fast dashboard loading."""
+    # Polls between refreshes return the already-encoded snapshot as-is
+    body = app.state.system_status_body or await _single_flight(
+        "system_status", _system_status_body
+    )
+    return Response(body, media_type="application/json")
+
+
+async def _status_refresher(app: FastAPI, interval: float = 5.0) -> None:
+    """Periodically recompute the system status snapshot in a worker thread."""
+    while True:
+        await asyncio.sleep(interval)
+        app.state.system_status_body = await asyncio.to_thread(_system_status_body)
 
 
-async def _get_system_status() -> Dict[str, Any]:
-    """Get comprehensive system status."""
+# Reused so cpu_percent() has a baseline and /proc lookups stay warm
+_PROCESS = psutil.Process()
+
+
+def _compute_system_status_sync() -> Dict[str, Any]:
+    """Get comprehensive system status (blocking; run in a worker thread)."""
     try:
-        import psutil
-        
-        # System information
+        # System information. psutil keeps the interval=None baseline per
+        # thread and this runs on whichever pool thread is free, so take a
+        # short blocking sample; we are already off the event loop here.
         cpu_percent = psutil.cpu_percent(interval=0.1)
         memory = psutil.virtual_memory()
         disk = psutil.disk_usage('/')
         
-        # Process information
-        process = psutil.Process()
-        process_memory = process.memory_info()
+        # Process information, read in a single batched pass
+        process = _PROCESS.as_dict(
+            attrs=["memory_info", "num_threads", "cpu_percent", "create_time"]
+        )
+        process_memory = process["memory_info"]
         
         return {
             "system": {
@@ -236,23 +538,28 @@ async def _get_system_status() -> Dict[str, Any]:
                 "memory_percent": memory.percent,
                 "memory_available_gb": memory.available / 1024 / 1024 / 1024,
                 "disk_free_gb": disk.free / 1024 / 1024 / 1024,
-                "uptime_seconds": time.time() - process.create_time(),
+                "uptime_seconds": time.time() - process["create_time"],
             },
             "process": {
                 "memory_rss_mb": process_memory.rss / 1024 / 1024,
                 "memory_vms_mb": process_memory.vms / 1024 / 1024,
-                "threads": process.num_threads(),
-                "cpu_percent": process.cpu_percent(),
+                "threads": process["num_threads"],
+                "cpu_percent": process["cpu_percent"],
             },
             "features": {
-                "enabled": list(settings.enabled_features),
-                "performance_monitoring": settings.monitoring.ENABLE_PERFORMANCE_MONITORING,
+                "enabled": ENABLED_FEATURES,
+                "performance_monitoring": ENABLE_PERFORMANCE_MONITORING,
                 "caching": True,
             },
-            "timestamp": time.time(),
+            "timestamp": time.time_ns() // 1_000_000_000,
         }
     except Exception as e:
-        return {"error": str(e), "timestamp": time.time()}
+        return {"error": str(e), "timestamp": time.time_ns() // 1_000_000_000}
+
+
+def _system_status_body() -> bytes:
+    """Compute and encode the system status snapshot (blocking)."""
+    return _encode_json(_compute_system_status_sync())
 
 
 # Plugin management endpoints
@@ -271,10 +578,9 @@ async def reload_plugin(plugin_name: str):
 
 
 # Configuration endpoints
-@app.get("/api/config")
-async def get_config():
-    """Get current configuration (sanitized)."""
-    config = {
+def _build_config() -> Dict[str, Any]:
+    """Build the sanitized configuration exposed by the dashboard."""
+    return {
         "app_name": settings.APP_NAME,
         "version": settings.VERSION,
         "debug": settings.DEBUG,
@@ -291,7 +597,14 @@ async def get_config():
             "caching_enabled": settings.performance.ENABLE_REDIS_CACHE,
         },
     }
-    return config
+
+
+@app.get("/api/config")
+async def get_config(request: Request):
+    """Get current configuration (sanitized), pre-encoded at startup."""
+    return _conditional_response(
+        request, app.state.config_bytes, app.state.config_etag, "public, max-age=30"
+    )
 
 
 @app.put("/api/config")
@@ -302,73 +615,199 @@ async def update_config(config_updates: Dict[str, Any]):
 
 
 # WebSocket endpoint for real-time metrics
+# One slot per client: a client that falls behind only ever has the newest
+# snapshot waiting, never a backlog of stale ones.
+_CLIENT_QUEUE_SIZE = 1
+_METRICS_INTERVAL = 2.0
+
+
+def _refresh_metrics_payload(app: FastAPI) -> str:
+    """Encode a fresh metrics snapshot and keep it as the latest payload."""
+    # Sent as text so browser clients can JSON.parse(event.data) directly
+    payload = _encode_json(performance_monitor.get_performance_report()).decode()
+    app.state.latest_metrics = payload
+    app.state.latest_metrics_at = time.monotonic()
+    return payload
+
+
+def _initial_metrics_payload(app: FastAPI) -> str:
+    """Latest snapshot for a new subscriber, rebuilt if the producer was idle."""
+    if (
+        app.state.latest_metrics is None
+        or time.monotonic() - app.state.latest_metrics_at >= _METRICS_INTERVAL
+    ):
+        return _refresh_metrics_payload(app)
+    return app.state.latest_metrics
+
+
+def _broadcast(clients: dict, payload: str) -> None:
+    """Queue a payload for every client without waiting on any socket."""
+    for queue in clients.values():
+        try:
+            queue.put_nowait(payload)
+        except asyncio.QueueFull:
+            # Slow client: replace the unsent snapshot with the latest one
+            queue.get_nowait()
+            queue.put_nowait(payload)
+
+
+async def _metrics_broadcaster(app: FastAPI, interval: float = _METRICS_INTERVAL) -> None:
+    """Build the metrics report once per tick and fan it out to all clients."""
+    clients = app.state.metric_subscribers
+    
+    while True:
+        await asyncio.sleep(interval)
+        if not clients:
+            continue
+        
+        # One bad tick must not end the only producer for every subscriber
+        try:
+            _broadcast(clients, _refresh_metrics_payload(app))
+        except Exception as e:
+            logger.error(f"Metrics broadcast failed: {e}")
+
+
+async def _client_sender(websocket: WebSocket, queue: asyncio.Queue) -> None:
+    """Drain one client's queue so a stalled socket only delays itself."""
+    try:
+        while True:
+            await websocket.send_text(await queue.get())
+    except Exception as e:
+        logger.debug("WebSocket sender stopped: %s", e)
+
+
 @app.websocket("/ws/metrics")
-async def websocket_metrics(websocket):
+async def websocket_metrics(websocket: WebSocket):
     """WebSocket endpoint for real-time performance metrics."""
     await websocket.accept()
-    logger = get_logger(__name__)
+    queue = asyncio.Queue(maxsize=_CLIENT_QUEUE_SIZE)
+    # New clients get the current snapshot now rather than on the next tick
+    queue.put_nowait(_initial_metrics_payload(app))
+    sender = asyncio.create_task(_client_sender(websocket, queue))
+    app.state.metric_subscribers[websocket] = queue
     
     try:
+        # Metrics are pushed by the broadcaster; just wait for disconnect
         while True:
-            # Send metrics every 2 seconds
-            metrics = performance_monitor.get_performance_report()
-            await websocket.send_json(metrics)
-            await asyncio.sleep(2)
+            await websocket.receive_text()
+    except WebSocketDisconnect:
+        pass
     except Exception as e:
         logger.error(f"WebSocket error: {e}")
+        try:
+            await websocket.close()
+        except RuntimeError:
+            pass  # Already closed
     finally:
-        await websocket.close()
+        app.state.metric_subscribers.pop(websocket, None)
+        sender.cancel()
+
+
+@app.get("/sse/metrics")
+async def sse_metrics():
+    """Server-sent events stream of the same snapshots pushed over /ws/metrics."""
+    async def event_stream():
+        queue = asyncio.Queue(maxsize=_CLIENT_QUEUE_SIZE)
+        queue.put_nowait(_initial_metrics_payload(app))
+        key = object()
+        app.state.metric_subscribers[key] = queue
+        try:
+            while True:
+                yield "data: " + await queue.get() + "\n\n"
+        finally:
+            app.state.metric_subscribers.pop(key, None)
+    
+    return StreamingResponse(
+        event_stream(),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache"},
+    )
 
 
 # Health check endpoint
-@app.get("/health")
-async def health_check():
-    """Fast health check endpoint."""
-    return {
-        "status": "healthy",
-        "timestamp": time.time(),
-        "version": settings.VERSION,
-    }
+class _HealthEndpoint:
+    """Bare ASGI endpoint serving a prebuilt health payload.
+    
+    The body never changes, so it is encoded once; the server time is sent
+    in the ``X-Server-Time`` header instead of being rebuilt into the body.
+    """
+    
+    def __init__(self) -> None:
+        body = _encode_json({"status": "healthy", "version": settings.VERSION})
+        self._body = body
+        self._etag_str = _make_etag(body)
+        self._etag = self._etag_str.encode()
+        self._headers = [
+            (b"content-type", b"application/json"),
+            (b"content-length", str(len(body)).encode()),
+            (b"etag", self._etag),
+            # Probes must still reach the server, but may skip the body
+            (b"cache-control", b"no-cache"),
+        ]
+        self._not_modified_headers = self._headers[2:]
+    
+    async def __call__(self, scope, receive, send):
+        server_time = time.time_ns() // 1_000_000_000
+        server_time_header = (b"x-server-time", str(server_time).encode())
+        
+        for name, value in scope["headers"]:
+            if name == b"if-none-match" and _etag_matches(value.decode("latin-1"), self._etag_str):
+                await send({
+                    "type": "http.response.start",
+                    "status": 304,
+                    "headers": [*self._not_modified_headers, server_time_header],
+                })
+                await send({"type": "http.response.body", "body": b""})
+                return
+        
+        await send({
+            "type": "http.response.start",
+            "status": 200,
+            "headers": [*self._headers, server_time_header],
+        })
+        await send({"type": "http.response.body", "body": self._body})
+
+
+# Register ahead of every other route so probes skip route matching
+app.router.routes.insert(0, Route("/health", endpoint=_HealthEndpoint(), methods=["GET"]))
 
 
 # Cache management endpoints
 @app.get("/api/cache/stats")
-async def get_cache_stats(
-    cache_manager: CacheManager = Depends(get_cache_manager)
-):
+async def get_cache_stats():
     """Get cache statistics."""
+    cache_manager = app.state.cache_manager
     return await cache_manager.get_stats()
 
 
 @app.delete("/api/cache")
-async def clear_cache(
-    cache_manager: CacheManager = Depends(get_cache_manager)
-):
+async def clear_cache():
     """Clear all cached data."""
+    cache_manager = app.state.cache_manager
     await cache_manager.clear()
     return {"message": "Cache cleared successfully"}
 
 
 # Error handlers
+_INTERNAL_ERROR_BODY = _encode_json({"error": "Internal server error"})  # Encoded once
+
+
 @app.exception_handler(404)
 async def not_found_handler(request: Request, exc: HTTPException):
     """Handle 404 errors with optimized response."""
-    return OptimizedJSONResponse(
+    return Response(
+        _encode_json({"error": "Not found", "path": request.url.path}),
         status_code=404,
-        content={"error": "Not found", "path": str(request.url.path)}
+        media_type="application/json",
     )
 
 
 @app.exception_handler(500)
 async def internal_error_handler(request: Request, exc: Exception):
     """Handle 500 errors with logging."""
-    logger = get_logger(__name__)
     logger.error(f"Internal server error: {exc}", exc_info=True)
     
-    return OptimizedJSONResponse(
-        status_code=500,
-        content={"error": "Internal server error"}
-    )
+    return Response(_INTERNAL_ERROR_BODY, status_code=500, media_type="application/json")
 
 
 class DashboardApp:
@@ -376,7 +815,6 @@ class DashboardApp:
     
     def __init__(self) -> None:
         self.app = app
-        self.logger = get_logger(__name__)
     
     def run(self, host: str = None, port: int = None) -> None:
         """Run the dashboard with optimized uvicorn settings."""
@@ -388,7 +826,8 @@ class DashboardApp:
             app=self.app,
             host=host,
             port=port,
-            loop="uvloop" if settings.performance.EVENT_LOOP_POLICY == "uvloop" else "asyncio",
+            loop=UVICORN_LOOP,
+            http=UVICORN_HTTP,
             workers=1,  # Single worker for dashboard
             log_level="info" if settings.DEBUG else "warning",
             access_log=settings.DEBUG,
@@ -398,11 +837,13 @@ class DashboardApp:
             limit_max_requests=10000,
             timeout_keep_alive=30,
             h11_max_incomplete_event_size=16 * 1024,  # 16KB
+            # Broadcast frames are shared across clients; don't deflate per socket
+            ws_per_message_deflate=False,
         )
         
         server = uvicorn.Server(config)
         
-        self.logger.info(f"Starting dashboard on http://{host}:{port}")
+        logger.info(f"Starting dashboard on http://{host}:{port}")
         server.run()
     
     async def start_async(self, host: str = None, port: int = None) -> None:
@@ -414,7 +855,9 @@ class DashboardApp:
             app=self.app,
             host=host,
             port=port,
-            loop="uvloop" if settings.performance.EVENT_LOOP_POLICY == "uvloop" else "asyncio",
+            loop=UVICORN_LOOP,
+            http=UVICORN_HTTP,
+            ws_per_message_deflate=False,
         )
         
         server = uvicorn.Server(config)
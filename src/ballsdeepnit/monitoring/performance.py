@@ -74,6 +74,10 @@ class PerformanceMonitor:
         self._last_disk_io = None
         self._last_network_io = None
         
+        # Reused so cpu_percent() measures against the previous sample
+        # instead of returning 0.0 from a freshly constructed Process.
+        self._process = psutil.Process()
+        
         # Setup Prometheus metrics if available
         if PROMETHEUS_AVAILABLE and settings.monitoring.ENABLE_PROMETHEUS:
             self._setup_prometheus_metrics()
@@ -124,7 +128,8 @@ class PerformanceMonitor:
         """Main monitoring loop."""
         while self.is_monitoring:
             try:
-                metrics = self._collect_system_metrics()
+                # psutil reads /proc synchronously; keep it off the event loop
+                metrics = await asyncio.to_thread(self._collect_system_metrics)
                 self.metrics_history.append(metrics)
                 
                 # Update Prometheus metrics
@@ -147,24 +152,34 @@ class PerformanceMonitor:
     def _collect_system_metrics(self) -> PerformanceMetrics:
         """Collect current system performance metrics."""
         try:
-            process = psutil.Process()
-            
-            # CPU and memory
-            cpu_percent = process.cpu_percent()
-            memory_info = process.memory_info()
-            memory_percent = process.memory_percent()
+            process = self._process
             
-            # I/O statistics
-            try:
-                io_counters = process.io_counters()
-                if self._last_disk_io:
-                    disk_read = (io_counters.read_bytes - self._last_disk_io.read_bytes) / 1024 / 1024
-                    disk_write = (io_counters.write_bytes - self._last_disk_io.write_bytes) / 1024 / 1024
-                else:
+            # Read the per-process stats from a single /proc pass
+            with process.oneshot():
+                # CPU and memory
+                cpu_percent = process.cpu_percent()
+                memory_info = process.memory_info()
+                memory_percent = process.memory_percent()
+                
+                # I/O statistics
+                try:
+                    io_counters = process.io_counters()
+                    if self._last_disk_io:
+                        disk_read = (io_counters.read_bytes - self._last_disk_io.read_bytes) / 1024 / 1024
+                        disk_write = (io_counters.write_bytes - self._last_disk_io.write_bytes) / 1024 / 1024
+                    else:
+                        disk_read = disk_write = 0.0
+                    self._last_disk_io = io_counters
+                except (psutil.AccessDenied, AttributeError):
                     disk_read = disk_write = 0.0
-                self._last_disk_io = io_counters
-            except (psutil.AccessDenied, AttributeError):
-                disk_read = disk_write = 0.0
+                
+                # Thread and file handle counts
+                try:
+                    active_threads = process.num_threads()
+                    open_files = len(process.open_files())
+                except (psutil.AccessDenied, AttributeError):
+                    active_threads = threading.active_count()
+                    open_files = 0
             
             # Network statistics
             try:
@@ -178,14 +193,6 @@ class PerformanceMonitor:
             except (psutil.AccessDenied, AttributeError):
                 net_sent = net_recv = 0
             
-            # Thread and file handle counts
-            try:
-                active_threads = process.num_threads()
-                open_files = len(process.open_files())
-            except (psutil.AccessDenied, AttributeError):
-                active_threads = threading.active_count()
-                open_files = 0
-            
             # Garbage collection stats
             gc_stats = {i: gc.get_count()[i] for i in range(3)}
             
@@ -279,8 +286,7 @@ class PerformanceMonitor:
         start_memory = 0
         
         try:
-            process = psutil.Process()
-            start_memory = process.memory_info().rss
+            start_memory = self._process.memory_info().rss
         except:
             pass
         
@@ -291,7 +297,7 @@ class PerformanceMonitor:
             
             end_memory = 0
             try:
-                end_memory = psutil.Process().memory_info().rss
+                end_memory = self._process.memory_info().rss
             except:
                 pass
             
@@ -7,7 +7,7 @@ import hashlib
 import pickle
 import time
 from pathlib import Path
-from typing import Any, Dict, List, Optional, Union
+from typing import Any, Dict, Optional, Union
 from functools import wraps
 
 try:
@@ -113,7 +113,9 @@ class CacheManager:
         
         # Cache warming configuration
         self._warm_cache_enabled = True
-        self._warm_cache_keys: List[str] = []
+        # Insertion-ordered dict used as an ordered set: O(1) membership,
+        # insert and removal, oldest keys first.
+        self._warm_cache_keys: Dict[str, None] = {}
     
     async def initialize(self) -> None:
         """Initialize cache backends."""
@@ -192,7 +194,7 @@ class CacheManager:
                         return result
                         
                 except Exception as e:
-                    self.logger.debug(f"Redis cache error for key {key}: {e}")
+                    self.logger.debug("Redis cache error for key %s: %s", key, e)
                     self.stats.errors += 1
             
             # Try disk cache as fallback
@@ -216,7 +218,7 @@ class CacheManager:
                         return value
                         
                 except Exception as e:
-                    self.logger.debug(f"Disk cache error for key {key}: {e}")
+                    self.logger.debug("Disk cache error for key %s: %s", key, e)
                     self.stats.errors += 1
             
             # Cache miss
@@ -249,7 +251,7 @@ class CacheManager:
                     await self.redis_client.setex(key, ttl, serialized)
                     success = True
                 except Exception as e:
-                    self.logger.debug(f"Redis cache set error for key {key}: {e}")
+                    self.logger.debug("Redis cache set error for key %s: %s", key, e)
                     self.stats.errors += 1
             
             # Store in disk cache
@@ -260,7 +262,7 @@ class CacheManager:
                     self.disk_cache.set(key, value, expire=expire_time)
                     success = True
                 except Exception as e:
-                    self.logger.debug(f"Disk cache set error for key {key}: {e}")
+                    self.logger.debug("Disk cache set error for key %s: %s", key, e)
                     self.stats.errors += 1
             
             if success:
@@ -269,10 +271,10 @@ class CacheManager:
                 # Track warm cache keys
                 if self._warm_cache_enabled:
                     if key not in self._warm_cache_keys:
-                        self._warm_cache_keys.append(key)
+                        self._warm_cache_keys[key] = None
                         # Limit warm cache key tracking
                         if len(self._warm_cache_keys) > 1000:
-                            self._warm_cache_keys = self._warm_cache_keys[-500:]
+                            self._warm_cache_keys = dict.fromkeys(list(self._warm_cache_keys)[-500:])
             
             duration = time.perf_counter() - start_time
             self.stats.total_time += duration
@@ -299,7 +301,7 @@ class CacheManager:
                     deleted = await self.redis_client.delete(key)
                     success = deleted > 0
                 except Exception as e:
-                    self.logger.debug(f"Redis cache delete error for key {key}: {e}")
+                    self.logger.debug("Redis cache delete error for key %s: %s", key, e)
                     self.stats.errors += 1
             
             # Delete from disk cache
@@ -308,15 +310,14 @@ class CacheManager:
                     deleted = self.disk_cache.delete(key)
                     success = success or deleted
                 except Exception as e:
-                    self.logger.debug(f"Disk cache delete error for key {key}: {e}")
+                    self.logger.debug("Disk cache delete error for key %s: %s", key, e)
                     self.stats.errors += 1
             
             if success:
                 self.stats.deletes += 1
                 
                 # Remove from warm cache keys
-                if key in self._warm_cache_keys:
-                    self._warm_cache_keys.remove(key)
+                self._warm_cache_keys.pop(key, None)
             
             return success
             
@@ -336,7 +337,7 @@ class CacheManager:
                     await self.redis_client.flushdb()
                     success = True
                 except Exception as e:
-                    self.logger.debug(f"Redis cache clear error: {e}")
+                    self.logger.debug("Redis cache clear error: %s", e)
                     self.stats.errors += 1
             
             # Clear disk cache
@@ -345,7 +346,7 @@ class CacheManager:
                     self.disk_cache.clear()
                     success = True
                 except Exception as e:
-                    self.logger.debug(f"Disk cache clear error: {e}")
+                    self.logger.debug("Disk cache clear error: %s", e)
                     self.stats.errors += 1
             
             # Clear warm cache keys
@@ -368,7 +369,7 @@ class CacheManager:
             serialized = json.dumps(value)
             await self.redis_client.setex(key, self.config["ttl_seconds"], serialized)
         except Exception as e:
-            self.logger.debug(f"Failed to promote key {key} to Redis: {e}")
+            self.logger.debug("Failed to promote key %s to Redis: %s", key, e)
     
     async def warm_cache(self, warm_data: Dict[str, Any]) -> None:
         """Pre-warm cache with frequently accessed data."""
@@ -438,23 +439,18 @@ def cached(ttl: int = 3600, namespace: str = "default", key_func: Optional[calla
             
             namespaced_key = CacheKey.namespace_key(namespace, cache_key)
             
-            # Try to get from cache
-            cache_manager = CacheManager()
-            await cache_manager.initialize()
+            # Try to get from cache (shared manager, not one per call)
+            cache_manager = await get_global_cache()
             
-            try:
-                cached_result = await cache_manager.get(namespaced_key)
-                if cached_result is not None:
-                    return cached_result
-                
-                # Execute function and cache result
-                result = await func(*args, **kwargs)
-                await cache_manager.set(namespaced_key, result, ttl=ttl)
-                
-                return result
-                
-            finally:
-                await cache_manager.close()
+            cached_result = await cache_manager.get(namespaced_key)
+            if cached_result is not None:
+                return cached_result
+            
+            # Execute function and cache result
+            result = await func(*args, **kwargs)
+            await cache_manager.set(namespaced_key, result, ttl=ttl)
+            
+            return result
         
         @wraps(func)
         def sync_wrapper(*args, **kwargs):
@@ -471,15 +467,23 @@ def cached(ttl: int = 3600, namespace: str = "default", key_func: Optional[calla
 
 # Global cache manager instance
 global_cache_manager: Optional[CacheManager] = None
+_global_cache_lock = asyncio.Lock()
 
 
 async def get_global_cache() -> CacheManager:
     """Get or create global cache manager."""
     global global_cache_manager
     
-    if global_cache_manager is None:
-        global_cache_manager = CacheManager()
-        await global_cache_manager.initialize()
+    if global_cache_manager is not None:
+        return global_cache_manager
+    
+    # Concurrent cold-start callers wait for one initialization instead of
+    # each opening their own Redis/disk backends.
+    async with _global_cache_lock:
+        if global_cache_manager is None:
+            manager = CacheManager()
+            await manager.initialize()
+            global_cache_manager = manager
     
     return global_cache_manager
 
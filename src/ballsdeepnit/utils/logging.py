@@ -2,11 +2,12 @@
 High-performance logging system with structured logging and buffering.
 """
 
+import asyncio
 import logging
 import logging.handlers
 import sys
 import time
-from functools import lru_cache
+from functools import lru_cache, wraps
 from pathlib import Path
 from typing import Any, Dict, Optional, Union
 
@@ -221,7 +222,11 @@ class PerformanceLogger:
             return 0.0
         
         duration = time.perf_counter() - self._start_times.pop(operation)
-        
+        self.log_duration(operation, duration, **kwargs)
+        return duration
+    
+    def log_duration(self, operation: str, duration: float, **kwargs: Any) -> None:
+        """Log the duration of a completed operation."""
         self.logger.info(
             f"Operation completed: {operation}",
             extra={
@@ -233,8 +238,6 @@ class PerformanceLogger:
                 }
             }
         )
-        
-        return duration
     
     def log_memory_usage(self, context: str, **kwargs: Any) -> None:
         """Log current memory usage."""
@@ -260,8 +263,14 @@ class PerformanceLogger:
     
     def log_metric(self, name: str, value: Union[int, float], unit: str = "", **kwargs: Any) -> None:
         """Log a custom performance metric."""
+        # Called on hot paths (every cache get/set); skip building the record
+        # entirely when INFO is filtered out.
+        if not self.logger.isEnabledFor(logging.INFO):
+            return
+        
         self.logger.info(
-            f"Metric: {name}",
+            "Metric: %s",
+            name,
             extra={
                 "performance": {
                     "metric_name": name,
@@ -280,14 +289,27 @@ perf_logger = PerformanceLogger()
 def timing_decorator(operation_name: Optional[str] = None):
     """Decorator to automatically time function execution."""
     def decorator(func):
+        op_name = operation_name or f"{func.__module__}.{func.__name__}"
+        
+        # Time with a local start so concurrent calls of the same operation
+        # do not overwrite each other's entry in perf_logger._start_times.
+        if asyncio.iscoroutinefunction(func):
+            @wraps(func)
+            async def async_wrapper(*args, **kwargs):
+                start = time.perf_counter()
+                try:
+                    return await func(*args, **kwargs)
+                finally:
+                    perf_logger.log_duration(op_name, time.perf_counter() - start)
+            return async_wrapper
+        
+        @wraps(func)
         def wrapper(*args, **kwargs):
-            op_name = operation_name or f"{func.__module__}.{func.__name__}"
-            perf_logger.start_timing(op_name)
+            start = time.perf_counter()
             try:
-                result = func(*args, **kwargs)
-                return result
+                return func(*args, **kwargs)
             finally:
-                perf_logger.end_timing(op_name)
+                perf_logger.log_duration(op_name, time.perf_counter() - start)
         return wrapper
     return decorator
 
@@ -0,0 +1,241 @@
+"""
+Tests for the ballsDeepnit dashboard application.
+"""
+
+import asyncio
+import json
+
+import pytest
+
+pytest.importorskip("fastapi")
+httpx = pytest.importorskip("httpx")
+
+from fastapi.testclient import TestClient
+
+from src.ballsdeepnit.dashboard import app as dashboard
+
+
+@pytest.fixture
+def client():
+    """Test client with the dashboard lifespan running."""
+    with TestClient(dashboard.app) as test_client:
+        yield test_client
+
+
+class TestJSONEncoding:
+    """Test that route output and pre-encoded bodies share one encoder."""
+
+    @pytest.mark.parametrize("response_class", ["_OrjsonResponse", "_StdlibResponse"])
+    def test_response_classes_match_encode_json(self, response_class):
+        """Both response classes encode non-JSON types the same way."""
+        if response_class == "_OrjsonResponse" and not dashboard.JSON_AVAILABLE:
+            pytest.skip("orjson not installed")
+        from datetime import datetime
+        from pathlib import Path
+
+        content = {"when": datetime(2024, 1, 2, 3, 4, 5), "where": Path("/tmp")}
+        response = getattr(dashboard, response_class)(content)
+        assert response.body == dashboard._encode_json(content)
+
+
+class TestRequestParsing:
+    """Test JSON request body parsing."""
+
+    def test_put_config_uses_optimized_route(self, client):
+        """PUT /api/config bodies are parsed through OptimizedRequest."""
+        if not dashboard.JSON_AVAILABLE:
+            pytest.skip("orjson not installed")
+
+        route = next(
+            r for r in dashboard.app.routes
+            if getattr(r, "path", None) == "/api/config" and "PUT" in r.methods
+        )
+        assert isinstance(route, dashboard.OptimizedRoute)
+
+        response = client.put("/api/config", json={"debug": True, "nested": {"a": [1, 2]}})
+        assert response.status_code == 200
+        assert response.json() == {"message": "Configuration updates not yet implemented"}
+
+    def test_put_config_rejects_invalid_json(self, client):
+        """Malformed bodies are still reported as validation errors."""
+        response = client.put(
+            "/api/config",
+            content=b"{not json",
+            headers={"content-type": "application/json"},
+        )
+        assert response.status_code == 422
+
+
+class TestCachedEndpoints:
+    """Test the snapshot and single-flight cached endpoints."""
+
+    @pytest.mark.asyncio
+    async def test_concurrent_metrics_misses_compute_once(self, monkeypatch):
+        """Concurrent cache misses share a single performance report."""
+        calls = []
+
+        def fake_report():
+            calls.append(1)
+            return {"report": len(calls)}
+
+        monkeypatch.setattr(dashboard.performance_monitor, "get_performance_report", fake_report)
+
+        async with dashboard.app.router.lifespan_context(dashboard.app):
+            await dashboard.app.state.cache_manager.clear()
+            transport = httpx.ASGITransport(app=dashboard.app)
+            async with httpx.AsyncClient(transport=transport, base_url="http://test") as ac:
+                responses = await asyncio.gather(
+                    *(ac.get("/api/performance/metrics") for _ in range(10))
+                )
+
+        assert all(r.status_code == 200 for r in responses)
+        assert all(r.json() == {"report": 1} for r in responses)
+        assert len(calls) == 1
+
+    def test_system_status_returns_snapshot_bytes(self, client):
+        """The status route serves the background snapshot unchanged."""
+        response = client.get("/api/system/status")
+        assert response.status_code == 200
+        assert response.headers["content-type"] == "application/json"
+        assert response.content == dashboard.app.state.system_status_body
+        assert "system" in response.json()
+
+
+class TestConditionalRequests:
+    """Test If-None-Match handling on pre-encoded endpoints."""
+
+    @pytest.mark.parametrize("path", ["/api/config", "/health"])
+    def test_multi_etag_header_returns_304(self, client, path):
+        """A matching ETag anywhere in an If-None-Match list is a 304."""
+        etag = client.get(path).headers["etag"]
+        opaque = etag.removeprefix("W/")
+
+        for header in (f'W/"stale", {etag}', f'"other",{opaque}', "*"):
+            response = client.get(path, headers={"If-None-Match": header})
+            assert response.status_code == 304, header
+            assert response.headers["etag"] == etag
+
+        response = client.get(path, headers={"If-None-Match": 'W/"stale", "other"'})
+        assert response.status_code == 200
+
+
+class TestMetricsStream:
+    """Test the real-time metrics WebSocket."""
+
+    def test_websocket_sends_text_snapshot_on_connect(self, client):
+        """New subscribers get a JSON text frame without waiting for a tick."""
+        with client.websocket_connect("/ws/metrics") as websocket:
+            message = websocket.receive()
+            assert "text" in message
+            assert isinstance(json.loads(message["text"]), dict)
+        assert not dashboard.app.state.metric_subscribers
+
+    @pytest.mark.asyncio
+    async def test_broadcaster_survives_failed_report(self, monkeypatch):
+        """A report that raises once does not stop later ticks."""
+        from types import SimpleNamespace
+
+        calls = []
+
+        def flaky_report():
+            calls.append(1)
+            if len(calls) == 1:
+                raise RuntimeError("report failed")
+            return {"tick": len(calls)}
+
+        monkeypatch.setattr(dashboard.performance_monitor, "get_performance_report", flaky_report)
+
+        queue = asyncio.Queue(maxsize=dashboard._CLIENT_QUEUE_SIZE)
+        fake_app = SimpleNamespace(state=SimpleNamespace(
+            metric_subscribers={"client": queue},
+            latest_metrics=None,
+            latest_metrics_at=0.0,
+        ))
+
+        task = asyncio.create_task(dashboard._metrics_broadcaster(fake_app, interval=0.01))
+        try:
+            payload = await asyncio.wait_for(queue.get(), timeout=1.0)
+        finally:
+            task.cancel()
+            with pytest.raises(asyncio.CancelledError):
+                await task
+
+        assert json.loads(payload) == {"tick": 2}
+
+    def test_broadcast_keeps_only_latest_snapshot(self):
+        """A client that has not sent its pending snapshot gets the newest one."""
+        queue = asyncio.Queue(maxsize=dashboard._CLIENT_QUEUE_SIZE)
+        clients = {"slow": queue}
+
+        for tick in range(5):
+            dashboard._broadcast(clients, f"tick-{tick}")
+
+        assert queue.qsize() == 1
+        assert queue.get_nowait() == "tick-4"
+
+
+class TestCompressionMiddleware:
+    """Test zstd/gzip response compression."""
+
+    @pytest.fixture
+    def compressed_client(self):
+        from starlette.applications import Starlette
+        from starlette.responses import Response, StreamingResponse
+        from starlette.routing import Route
+
+        body = b'{"data":"' + b"x" * 4000 + b'"}'
+
+        async def full(request):
+            return Response(body, media_type="application/json")
+
+        async def streamed(request):
+            async def chunks():
+                for _ in range(4):
+                    yield b"y" * 1000
+            return StreamingResponse(chunks(), media_type="text/plain")
+
+        inner = Starlette(routes=[Route("/full", full), Route("/stream", streamed)])
+        with TestClient(dashboard.CompressionMiddleware(inner)) as test_client:
+            yield test_client, body
+
+    @pytest.mark.parametrize(
+        "accept_encoding, expected",
+        [
+            ("gzip, deflate, br, zstd", "zstd"),
+            ("gzip", "gzip"),
+            ("zstd;q=0, gzip", "gzip"),
+            ("identity", None),
+        ],
+    )
+    def test_negotiates_encoding(self, compressed_client, accept_encoding, expected):
+        """Accept-Encoding picks zstd, gzip or nothing, honouring q=0."""
+        if expected == "zstd" and not dashboard.ZSTD_AVAILABLE:
+            pytest.skip("zstandard not installed")
+        client, body = compressed_client
+        response = client.get("/full", headers={"Accept-Encoding": accept_encoding})
+        assert response.headers.get("content-encoding") == expected
+        assert response.content == body
+
+    def test_streaming_response_is_zstd_compressed(self, compressed_client):
+        """Streamed bodies are compressed chunk by chunk instead of sent raw."""
+        if not dashboard.ZSTD_AVAILABLE:
+            pytest.skip("zstandard not installed")
+        import zstandard
+
+        client, _ = compressed_client
+        response = client.get("/stream", headers={"Accept-Encoding": "gzip, zstd"})
+        assert response.headers["content-encoding"] == "zstd"
+        assert "content-length" not in response.headers
+        assert response.content == b"y" * 4000
+
+        # The raw stream decodes as a single zstd frame
+        with client.stream("GET", "/stream", headers={"Accept-Encoding": "zstd"}) as raw:
+            compressed = b"".join(raw.iter_raw())
+        reader = zstandard.ZstdDecompressor().stream_reader(compressed)
+        assert reader.read() == b"y" * 4000
+
+    def test_small_bodies_are_not_compressed(self, compressed_client):
+        """Responses under minimum_size pass through untouched."""
+        client, _ = compressed_client
+        response = client.get("/missing", headers={"Accept-Encoding": "zstd"})
+        assert "content-encoding" not in response.headers